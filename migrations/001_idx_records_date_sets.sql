@@ -0,0 +1,7 @@
+-- GET /workouts/ 페이지 조회(ORDER BY record_date DESC, sets ASC, id ASC LIMIT/OFFSET)용 복합 인덱스
+-- 같은 날짜/세트의 행도 순서가 고정되도록 고유 키 id를 마지막 정렬 컬럼으로 사용 (페이지 간 중복/누락 방지)
+-- id가 이미 있으면 그대로 사용하고, 없으면 자동 증가 고유 키로 추가
+ALTER TABLE records ADD COLUMN IF NOT EXISTS id BIGINT GENERATED BY DEFAULT AS IDENTITY UNIQUE;
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 단독으로 실행
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_records_date_sets
+    ON records (record_date DESC, sets ASC, id ASC);
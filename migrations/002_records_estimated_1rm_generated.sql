@@ -0,0 +1,14 @@
+-- estimated_1rm을 애플리케이션 대신 DB에서 계산하는 생성 컬럼으로 변경 (Epley 공식)
+-- weight * (1 + reps / 30)을 numeric으로 계산하여 round (numeric round는 .5를 0에서 먼 쪽으로 = 양수는 올림)
+--   models.estimate_1rm_epley의 정수 half-up 계산과 같은 결과 (컬럼이 integer/numeric 어느 쪽이어도 동일)
+--   reps / 30.0을 먼저 나누면 1/30 같은 순환소수가 잘려 .5 경계 값이 내려갈 수 있으므로 곱한 뒤 마지막에 나눔
+-- 중량 <= 0 또는 횟수 < 0이면 NULL
+-- 주의: 컬럼을 다시 만들기 때문에 기존 행의 값도 이 식으로 다시 계산됨
+--       (이전 Python round()는 .5를 짝수 쪽으로 반올림했으므로 .5인 기록은 1 커질 수 있음)
+ALTER TABLE records DROP COLUMN IF EXISTS estimated_1rm;
+ALTER TABLE records
+    ADD COLUMN estimated_1rm INTEGER GENERATED ALWAYS AS (
+        CASE WHEN weight > 0 AND reps >= 0
+             THEN round(weight::NUMERIC * (30 + reps) / 30)::INTEGER
+        END
+    ) STORED;
@@ -1,6 +1,6 @@
 # src/workout_importer/abstracts.py
 import abc
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Iterable
 
 
 # AbstractDatabaseManager 클래스 정의 시 ABC 대신 abc.ABC 사용
@@ -19,17 +19,41 @@ class AbstractDatabaseManager(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def insert_records(self, records_list: List[Any]) -> int:
+    def insert_records(self, records_list: List[Any], raise_errors: bool = False) -> int:
         """
         데이터베이스에 기록 목록을 삽입.
+        삽입된 기록 수 반환 (raise_errors=True이면 실패 시 0 대신 예외 발생).
+        """
+        pass
+
+    @abc.abstractmethod
+    def insert_records_tuples(self, rows: List[tuple]) -> int:
+        """
+        (record_date, exercise_type, weight, reps, sets) 튜플 목록을 삽입.
         삽입된 기록 수 반환.
         """
         pass
 
+    @abc.abstractmethod
+    def insert_records_stream(self, rows: Iterable[tuple], chunk_size: int = 500) -> int:
+        """
+        튜플 이터러블을 chunk_size개씩 나누어 하나의 트랜잭션으로 삽입.
+        삽입된 기록 수 반환 (실패 시 전체 롤백 후 0).
+        """
+        pass
+
     @abc.abstractmethod
     def fetch_records(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """
         쿼리를 사용하여 데이터베이스에서 기록 가져오기
         딕셔너리 목록을 반환
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abc.abstractmethod
+    def stream_records(self, query: str, params: tuple = None) -> Iterator[Dict[str, Any]]:
+        """
+        쿼리 결과를 전부 메모리에 올리지 않고 한 행씩 가져오기
+        딕셔너리 이터레이터를 반환 (연결 실패와 조회 오류는 빈 결과 대신 호출자에게 발생)
+        """
+        pass
@@ -1,24 +1,46 @@
 # src/workout_importer/api/app.py
 from flask import Flask
 import os
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from flask_cors import CORS
+from psycopg2.pool import ThreadedConnectionPool
 from ..abstracts import AbstractDatabaseManager
 from .workout_routes import workout_bp
 from ..config import config_by_name
-from ..database.db_utils import get_db_manager, close_db_manager
+from ..database.postgres_manager import PostgreSQLDatabaseManager
+from ..database.record_buffer import RecordBuffer
 from .error_handlers import register_api_error_handlers
+from .json_provider import ORJSONProvider
+from ..services.workout_service import WorkoutService
 
+# 패키지 최상위 로거 이름 (예: 'src.workout') - 하위 모듈의 getLogger(__name__)가 모두 이 아래에 속함
+_PACKAGE_LOGGER_NAME = __name__.rsplit('.', 2)[0]
 
-def get_db_manager() -> AbstractDatabaseManager:
-    pass
 
-def close_db_manager(e=None):
-    pass
+def configure_logging(level: int = logging.INFO) -> logging.Logger:
+    """패키지 로거가 큐를 통해 백그라운드 스레드에서 로그를 출력하도록 설정합니다."""
+    logger = logging.getLogger(_PACKAGE_LOGGER_NAME)
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return logger # 이미 설정됨 (create_app 재호출 시)
+
+    # 요청 스레드는 큐에 넣기만 하고, 실제 stderr 출력은 리스너 스레드가 담당
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    return logger
 
 
 def create_app(config_name='default'):
     """Flask 애플리케이션 팩토리 함수."""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
 
     config_object = config_by_name.get(config_name)
     if config_object is None:
@@ -26,14 +48,39 @@ def create_app(config_name='default'):
 
     app.config.from_object(config_object)
 
+    configure_logging()
+
+    # 요청마다 새로 연결하지 않도록 앱 시작 시 연결 풀 생성 (Flask 확장 레지스트리에 등록)
+    # POOL_MAX_CONN은 요청 스레드 몫이며, 버퍼 사용 시 백그라운드 저장 스레드용 연결 1개를 더 둠
+    # (ThreadedConnectionPool은 고갈 시 기다리지 않고 PoolError를 발생시킴)
+    max_conn = app.config['POOL_MAX_CONN'] + (1 if app.config['BUFFERED_INSERTS'] else 0)
+    db_pool = ThreadedConnectionPool(app.config['POOL_MIN_CONN'],
+                                     max_conn,
+                                     **app.config['DB_PARAMS'])
+    app.extensions['db_pool'] = db_pool
+    # atexit은 역순으로 실행되므로 아래에서 등록하는 버퍼 저장이 끝난 뒤 풀을 닫음
+    atexit.register(db_pool.closeall)
+    # 작업마다 풀에서 연결을 빌려 쓰는 관리자 하나를 앱 전체에서 공유
+    db_manager = PostgreSQLDatabaseManager.from_pool(db_pool)
+    app.extensions['db_manager'] = db_manager
+
     CORS(app)
 
-    app.get_db_manager = get_db_manager
+    # 설정 시 POST 기록을 모아서 저장하는 버퍼 생성 (종료 시 남은 기록 저장)
+    record_buffer = None
+    if app.config['BUFFERED_INSERTS']:
+        record_buffer = RecordBuffer(db_manager,
+                                     flush_size=app.config['BUFFER_FLUSH_SIZE'],
+                                     flush_interval=app.config['BUFFER_FLUSH_INTERVAL'],
+                                     max_size=app.config['BUFFER_MAX_SIZE'])
+        atexit.register(record_buffer.close)
 
-    app.teardown_appcontext(close_db_manager)
+    # 서비스는 요청별 상태가 없으므로 앱 생성 시 한 번만 만들어 재사용
+    app.workout_service = WorkoutService(db_manager, record_buffer)
 
-    app.register_blueprint(workout_bp)
+    # 오류 핸들러는 블루프린트가 아닌 앱 전체에 등록
+    register_api_error_handlers(app)
 
-    register_api_error_handlers(workout_bp)
+    app.register_blueprint(workout_bp)
 
     return app
\ No newline at end of file
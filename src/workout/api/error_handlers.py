@@ -1,25 +1,40 @@
+import logging
 from flask import jsonify, Blueprint, Flask
-from ..services.workout_service import ValidationError, DatabaseServiceError
+from werkzeug.exceptions import HTTPException
+from ..services.workout_service import ValidationError, DatabaseServiceError, ServiceUnavailableError
+
+log = logging.getLogger(__name__)
 
 # 오류 핸들러 함수 정의
 def handle_validation_error(error):
     """ValidationError 발생 시 처리"""
-    print(f"Caught Validation Error in handler: {error}")
+    log.warning("Caught Validation Error in handler: %s", error)
     return jsonify({"message": str(error)}), 400
 
 def handle_database_service_error(error):
     """DatabaseServiceError 발생 시 처리"""
-    print(f"Caught Database Service Error in handler: {error}")
+    log.exception("Caught Database Service Error in handler: %s", error)
     return jsonify({"message": str(error)}), 500
 
+def handle_service_unavailable_error(error):
+    """ServiceUnavailableError 발생 시 처리 (잠시 후 다시 시도하면 되는 오류)"""
+    log.warning("Caught Service Unavailable Error in handler: %s", error)
+    return jsonify({"message": str(error)}), 503
+
 def handle_generic_error(error):
-    print(f"Caught Generic Error in handler: {error}")
+    """그 밖의 예외 발생 시 처리 (404, 405 등 HTTP 예외는 Flask 기본 응답 유지)"""
+    if isinstance(error, HTTPException):
+        return error
+    log.exception("Caught Generic Error in handler: %s", error)
     return jsonify({"message": "An unexpected server error occurred."}), 500
 
 
 # 오류 핸들러를 블루프린트 또는 앱에 등록하는 함수
+# Exception 핸들러는 라우팅 단계 오류까지 잡을 수 있도록 앱에 등록해야 함
 def register_api_error_handlers(blueprint_or_app):
     """주어진 블루프린트 또는 앱에 API 관련 오류 핸들러를 등록합니다."""
     blueprint_or_app.register_error_handler(ValidationError, handle_validation_error)
     blueprint_or_app.register_error_handler(DatabaseServiceError, handle_database_service_error)
-    blueprint_or_app.register_error_handler(Exception, handle_generic_error) # 전역 핸들러 등록 예시
+    # 하위 클래스 핸들러가 DatabaseServiceError 핸들러보다 우선 적용됨
+    blueprint_or_app.register_error_handler(ServiceUnavailableError, handle_service_unavailable_error)
+    blueprint_or_app.register_error_handler(Exception, handle_generic_error)
@@ -0,0 +1,26 @@
+# src/workout/api/json_provider.py
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# date/datetime은 orjson이 ISO 8601 문자열로 직접 직렬화 (dataclass 직렬화는 orjson 3.x 기본 동작)
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify 등 Flask의 JSON 직렬화를 orjson으로 처리하는 프로바이더."""
+
+    def dumps_bytes(self, obj: Any, **kwargs: Any) -> bytes:
+        """객체를 JSON 바이트열로 직렬화합니다 (스트리밍 응답용). sort_keys/indent 설정을 orjson 옵션으로 변환."""
+        option = ORJSON_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            # orjson은 2칸 들여쓰기만 지원 (Flask 디버그 모드의 기본 indent=2와 같음)
+            option |= orjson.OPT_INDENT_2
+        # orjson이 모르는 타입(Decimal 등)은 문자열로 변환
+        return orjson.dumps(obj, default=str, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj, **kwargs).decode()
@@ -1,5 +1,5 @@
-from flask import Blueprint, request, jsonify, current_app, g
-from ..services.workout_service import WorkoutService, ValidationError, DatabaseServiceError 
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+from ..services.workout_service import DEFAULT_PAGE_SIZE
 
 workout_bp = Blueprint('workout_api', __name__, url_prefix='/workouts')
 
@@ -7,34 +7,57 @@ workout_bp = Blueprint('workout_api', __name__, url_prefix='/workouts')
 @workout_bp.route('/', methods=['POST'])
 def add_workout_record():
     raw_data = request.get_json()
-    db_manager = current_app.get_db_manager()
-    workout_service = WorkoutService(db_manager)
+    workout_service = current_app.workout_service
 
-    try:
-        new_record = workout_service.add_record(raw_data)
+    # 서비스에서 발생한 ValidationError / DatabaseServiceError는 앱에 등록된 오류 핸들러가 처리
+    if workout_service.record_buffer is not None:
+        # 버퍼에 추가만 하고 저장은 백그라운드에서 일괄 처리
+        new_record = workout_service.queue_record(raw_data)
         return jsonify({
-            "message": "Workout record saved successfully",
+            "message": "Workout record accepted",
             "estimated_1rm_for_set": new_record.estimated_1rm
-        }), 201
-    
-    except Exception as e:
-        # 서비스 호출 중 예상치 못한 다른 예외 발생 시
-        print(f"Unexpected Error in route (before service handler): {e}")
-        return jsonify({"message": "An unexpected error occurred."}), 500
+        }), 202
 
+    new_record = workout_service.add_record(raw_data)
+    return jsonify({
+        "message": "Workout record saved successfully",
+        "estimated_1rm_for_set": new_record.estimated_1rm
+    }), 201
 
-# GET /workouts/ : 전체 운동 기록 조회
-@workout_bp.route('/', methods=['GET'])
-def get_workout_records():
-    db_manager = current_app.get_db_manager()
-    workout_service = WorkoutService(db_manager)
 
-    try:
-        records_data = workout_service.get_all_records()
-        return jsonify(records_data), 200
+# POST /workouts/batch : 운동 세션 전체(여러 세트) 기록을 한 번에 추가
+@workout_bp.route('/batch', methods=['POST'])
+def add_workout_records():
+    raw_data_list = request.get_json()
+    workout_service = current_app.workout_service
+
+    new_records = workout_service.add_records(raw_data_list)
+    return jsonify({
+        "message": f"{len(new_records)} workout records saved successfully",
+        "estimated_1rm_for_sets": [record.estimated_1rm for record in new_records]
+    }), 201
 
-    except Exception as e:
-        # 서비스 호출 중 예상치 못한 다른 예외 발생 시
-        print(f"Unexpected Error in route (before service handler): {e}")
-        return jsonify({"message": "An unexpected error occurred."}), 500
 
+# GET /workouts/ : 운동 기록 페이지 조회 (?limit=&offset=)
+@workout_bp.route('/', methods=['GET'])
+def get_workout_records():
+    workout_service = current_app.workout_service
+
+    def generate(records):
+        # 행을 하나씩 직렬화하여 JSON 배열 형태로 스트리밍 (jsonify와 같은 앱 JSON 프로바이더 설정 사용)
+        dump = current_app.json.dumps_bytes
+        yield b'['
+        for i, record in enumerate(records):
+            if i:
+                yield b','
+            yield dump(record)
+        yield b']'
+
+    # 페이지 파라미터 검증과 첫 행 조회는 응답 시작 전에 수행
+    # (ValidationError는 400, 연결/쿼리 오류는 DatabaseServiceError로 500 처리)
+    records = workout_service.stream_records_page(
+        request.args.get('limit', DEFAULT_PAGE_SIZE),
+        request.args.get('offset', 0)
+    )
+    # 전체 결과를 메모리에 모으지 않고 조회되는 대로 클라이언트에 전송
+    return Response(stream_with_context(generate(records)), status=200, mimetype='application/json')
@@ -24,8 +24,32 @@ class BaseConfig:
         "port": DB_PORT,
     }
 
-    # 필수 DB 설정 값 누락 확인 (설정 로드 시 오류 발생)
+    # 연결 풀 크기 설정
+    POOL_MAX_CONN = int(os.environ.get("POOL_MAX_CONN", "10"))
+    # 풀은 minconn을 넘는 연결을 반납 시 닫으므로, 기본값을 최대 크기와 같게 두어
+    # 부하 중 재연결과 연결마다 반복되는 PREPARE + COMMIT을 피함
+    POOL_MIN_CONN = int(os.environ.get("POOL_MIN_CONN", str(POOL_MAX_CONN)))
+
+    # POST 기록을 메모리에 모아 일괄 저장할지 여부 (True면 202 Accepted로 응답)
+    BUFFERED_INSERTS = os.environ.get("BUFFERED_INSERTS", "false").lower() == "true"
+    BUFFER_FLUSH_SIZE = int(os.environ.get("BUFFER_FLUSH_SIZE", "1000"))
+    BUFFER_FLUSH_INTERVAL = float(os.environ.get("BUFFER_FLUSH_INTERVAL", "0.5"))
+    # DB 장애로 저장이 계속 실패할 때 버퍼에 보관할 최대 기록 수 (초과 시 새 요청 거절)
+    BUFFER_MAX_SIZE = int(os.environ.get("BUFFER_MAX_SIZE", str(BUFFER_FLUSH_SIZE * 10)))
+
+    # 필수 DB 설정 값 (설정 로드 시 누락 확인)
     REQUIRED_DB_PARAMS = ["database", "user", "password", "host", "port"]
-    if not all(DB_PARAMS.get(key) for key in REQUIRED_DB_PARAMS):
-         # raise EnvironmentError("Database configuration environment variables not set.")
-         print("경고: 데이터베이스 연결 설정 환경 변수가 누락되었습니다!")
+
+
+# 필수 DB 설정 값 누락 확인
+# (클래스 본문 안의 제너레이터 식은 클래스 속성을 볼 수 없으므로 클래스 정의 후에 확인)
+if not all(BaseConfig.DB_PARAMS.get(key) for key in BaseConfig.REQUIRED_DB_PARAMS):
+     # raise EnvironmentError("Database configuration environment variables not set.")
+     print("경고: 데이터베이스 연결 설정 환경 변수가 누락되었습니다!")
+
+
+# create_app(config_name)에서 사용하는 설정 이름별 매핑
+config_by_name = {
+    "default": BaseConfig,
+    "development": BaseConfig,
+}
@@ -1,128 +1,295 @@
 # src/workout_importer/database/postgres_manager.py
 import psycopg2
 import os
-from typing import List, Dict, Any, Optional
+import logging
+import io
+import csv
+import weakref
+import struct
+from itertools import islice
+from datetime import date
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator, Iterable
 import psycopg2.extensions
+from psycopg2.pool import AbstractConnectionPool
+from psycopg2.extras import execute_batch, RealDictCursor
 
 # 상위 패키지에서 추상 클래스 및 모델 임포트
 from ..abstracts import AbstractDatabaseManager
-from ..models import WorkoutRecord
+from ..models import WorkoutRecord, record_as_tuple
+
+log = logging.getLogger(__name__)
+
+# 준비된 문장(PREPARE)은 세션 단위이므로, 이미 준비를 마친 연결을 기록 (연결 풀에서 재사용됨)
+_prepared_connections: "weakref.WeakSet[psycopg2.extensions.connection]" = weakref.WeakSet()
+
+# COPY BINARY 형식 헤더: 시그니처 + 플래그(int32) + 헤더 확장 길이(int32)
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack(">h", -1)
+# PostgreSQL date의 기준일 (2000-01-01부터의 일수로 전송)
+_PG_EPOCH_ORDINAL = date(2000, 1, 1).toordinal()
+
+
+def _rollback(conn: psycopg2.extensions.connection):
+    """연결이 열려 있을 때만 롤백합니다 (서버가 끊은 연결은 롤백할 수 없고 반납 시 풀이 폐기)."""
+    if not conn.closed:
+        conn.rollback()
+
+
+def _encode_copy_binary(rows: List[tuple]) -> io.BytesIO:
+    """(date, text, int4 x3) 튜플 목록을 COPY BINARY 형식 버퍼로 인코딩합니다."""
+    pack_count = struct.Struct(">h").pack
+    pack_int4 = struct.Struct(">ii").pack # (필드 길이 4, 값)
+    pack_len = struct.Struct(">i").pack
+    null_field = pack_len(-1)
+
+    buf = io.BytesIO()
+    write = buf.write
+    write(_PGCOPY_HEADER)
+    for record_date, exercise_type, *int_fields in rows:
+        write(pack_count(2 + len(int_fields)))
+        write(pack_int4(4, record_date.toordinal() - _PG_EPOCH_ORDINAL))
+        text = exercise_type.encode("utf-8")
+        write(pack_len(len(text)))
+        write(text)
+        for value in int_fields:
+            write(null_field if value is None else pack_int4(4, value))
+    write(_PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
 
 class PostgreSQLDatabaseManager(AbstractDatabaseManager):
-    
-    def __init__(self, db_params: Dict[str, Any]):
-        self.db_params = db_params # 데이터베이스 연결 매개변수 저장
-        self._conn: Optional[psycopg2.connection] = None # 연결 객체 (초기 None)
-        self._cur: Optional[psycopg2.cursor] = None # 커서 객체 (초기 None)
+
+    # 서버 측 커서로 스트리밍 조회 시 한 번에 가져올 행 수
+    STREAM_ITERSIZE = 2000
+
+    # 이 개수 미만의 레코드는 COPY 대신 준비된 INSERT 문으로 삽입 (API 단건 요청 경로)
+    COPY_THRESHOLD = 50
+    # 연결마다 한 번만 PREPARE 되는 INSERT 문 이름
+    INSERT_STATEMENT = "ins_record"
+
+    def __init__(self, db_params: Optional[Dict[str, Any]], pool: Optional[AbstractConnectionPool] = None):
+        self.db_params = db_params # 데이터베이스 연결 매개변수 저장 (단일 연결 모드)
+        self._pool = pool # 연결 풀 (설정 시 작업마다 연결을 빌리고 반납)
+        self._conn: Optional[psycopg2.extensions.connection] = None # 단일 연결 모드의 연결 객체 (초기 None)
+
+    @classmethod
+    def from_pool(cls, pool: AbstractConnectionPool) -> "PostgreSQLDatabaseManager":
+        """연결 풀을 사용하는 인스턴스를 생성합니다. 여러 스레드가 하나의 인스턴스를 공유할 수 있습니다."""
+        return cls(db_params=None, pool=pool)
 
     def connect(self) -> bool:
         """PostgreSQL 데이터베이스 연결을 설정합니다."""
+        if self._pool is not None:
+            # 연결 풀 모드에서는 작업마다 연결을 빌리므로 풀 사용 가능 여부만 확인
+            return not self._pool.closed
         # 연결이 없거나 닫혀있으면 새로 연결 시도
         if self._conn is None or self._conn.closed != 0:
             try:
-                print("PostgreSQL 데이터베이스 연결 중...")
+                log.debug("PostgreSQL 데이터베이스 연결 중...")
                 self._conn = psycopg2.connect(**self.db_params)
-                print("PostgreSQL 데이터베이스 연결 성공.")
-                return True # 연결 성공
+                log.debug("PostgreSQL 데이터베이스 연결 성공.")
             except psycopg2.OperationalError as e:
-                print(f"PostgreSQL 연결 오류 발생: {e}")
+                log.error("PostgreSQL 연결 오류 발생: %s", e)
                 self._conn = None # 연결 실패 시 객체 초기화
                 return False # 연결 실패
             except Exception as e:
-                print(f"PostgreSQL 연결 중 알 수 없는 오류 발생: {e}")
+                log.exception("PostgreSQL 연결 중 알 수 없는 오류 발생: %s", e)
                 self._conn = None # 연결 실패 시 객체 초기화
                 return False # 연결 실패
         else:
-            print("기존 PostgreSQL 데이터베이스 연결 재사용.")
-            return True # 기존 연결 재사용
+            log.debug("기존 PostgreSQL 데이터베이스 연결 재사용.")
+
+        self._prepare(self._conn)
+        return True # 연결 성공 또는 기존 연결 재사용
+
+    def _prepare(self, conn: psycopg2.extensions.connection):
+        """records INSERT 문을 서버 측 준비된 문장으로 등록합니다 (연결당 한 번)."""
+        if conn in _prepared_connections:
+            return # 이 연결에서는 이미 준비됨
+        # estimated_1rm은 DB 생성 컬럼이므로 삽입 컬럼에서 제외
+        prepare_sql = f"""
+        PREPARE {self.INSERT_STATEMENT} AS
+        INSERT INTO records (record_date, exercise_type, weight, reps, sets)
+        VALUES ($1, $2, $3, $4, $5)
+        """
+        try:
+            with conn.cursor() as cur:
+                cur.execute(prepare_sql)
+            conn.commit() # 준비 문장 등록을 트랜잭션과 분리
+            _prepared_connections.add(conn)
+        except psycopg2.Error as e:
+            log.error("INSERT 문 준비 중 오류 발생: %s", e)
+            _rollback(conn)
+
+    @contextmanager
+    def _acquire(self) -> Iterator[Optional[psycopg2.extensions.connection]]:
+        """작업 하나 동안 사용할 연결을 제공합니다. 연결할 수 없으면 None을 제공합니다."""
+        if self._pool is None:
+            # 단일 연결 모드: 기존 연결 확인/재연결
+            yield self._conn if self.connect() else None
+            return
+
+        # 연결 풀 모드: 작업 동안만 연결을 빌리고 끝나면 즉시 반납
+        # 서버 재시작 등으로 끊어진 연결은 해당 작업이 실패한 뒤에야 closed로 표시되며,
+        # 반납 시 풀이 닫힌 연결을 폐기하므로 다음 작업은 새 연결을 받음 (실패한 작업은 재시도하지 않음)
+        try:
+            conn = self._pool.getconn()
+        except psycopg2.Error as e:
+            log.error("연결 풀에서 연결을 가져오지 못했습니다: %s", e)
+            yield None
+            return
+        try:
+            self._prepare(conn)
+            yield conn
+        finally:
+            self._pool.putconn(conn) # 진행 중인 트랜잭션은 풀에서 롤백 처리
 
     def close(self):
-        """PostgreSQL 데이터베이스 커서와 연결을 닫습니다."""
-        if self._cur:
-            self._cur.close() # 커서 닫기
-            self._cur = None
+        """PostgreSQL 데이터베이스 연결을 닫습니다. 연결 풀 모드에서는 아무것도 하지 않습니다."""
+        # 연결 풀은 앱(app.extensions['db_pool'])이 소유하므로 관리자가 닫지 않음
         if self._conn:
             self._conn.close() # 연결 닫기
             self._conn = None
-            print("PostgreSQL 데이터베이스 연결 닫힘.")
-
-    def _get_cursor(self) -> Optional[psycopg2.extensions.cursor]:
-         """현재 연결로부터 커서를 가져옵니다."""
-         # 연결이 활성화되어 있는지 확인
-         if self._conn is None or self._conn.closed != 0:
-             print("오류: 데이터베이스 연결이 활성화되어 있지 않습니다.")
-             return None
-         # 새로운 커서 객체 생성 및 반환
-         return self._conn.cursor()
-
-    def insert_records(self, records_list: List[WorkoutRecord]) -> int:
-        """WorkoutRecord 객체 목록을 PostgreSQL의 'records' 테이블에 삽입"""
-        if not records_list: # 삽입할 레코드가 없으면 0 반환
-            print("삽입할 레코드가 없습니다.")
-            return 0
+            log.debug("PostgreSQL 데이터베이스 연결 닫힘.")
 
-        # 삽입 전에 데이터베이스 연결 확인/재연결
-        if not self.connect():
-             print("데이터베이스 연결 실패로 삽입을 진행할 수 없습니다.")
-             return 0
+    def _execute_prepared(self, cur: psycopg2.extensions.cursor, rows: List[tuple]):
+        """준비된 INSERT 문으로 여러 행을 삽입합니다 (한 번의 왕복으로 묶어 전송)."""
+        execute_sql = f"EXECUTE {self.INSERT_STATEMENT} (%s, %s, %s, %s, %s)"
+        execute_batch(cur, execute_sql, rows, page_size=self.COPY_THRESHOLD)
 
-        # INSERT SQL 쿼리문
-        insert_sql = """
-        INSERT INTO records (record_date, exercise_type, weight, reps, sets, estimated_1rm)
-        VALUES (%s, %s, %s, %s, %s, %s)
+    def _copy_rows(self, cur: psycopg2.extensions.cursor, rows: List[tuple]):
+        """여러 행을 메모리 내 CSV 버퍼에 기록한 뒤 COPY FROM STDIN으로 삽입합니다."""
+        copy_sql = """
+        COPY records (record_date, exercise_type, weight, reps, sets)
+        FROM STDIN WITH CSV
+        """
+        # None은 빈 값으로 기록되어 CSV COPY에서 NULL로 처리됨
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+        cur.copy_expert(copy_sql, buf)
+
+    def _copy_rows_binary(self, cur: psycopg2.extensions.cursor, rows: List[tuple]):
+        """여러 행을 COPY BINARY 형식으로 인코딩하여 삽입합니다 (서버 측 텍스트 파싱 생략)."""
+        copy_sql = """
+        COPY records (record_date, exercise_type, weight, reps, sets)
+        FROM STDIN WITH (FORMAT BINARY)
+        """
+        cur.copy_expert(copy_sql, _encode_copy_binary(rows))
+
+    def _write_rows(self, cur: psycopg2.extensions.cursor, rows: List[tuple], binary: bool = False):
+        """행 개수에 따라 준비된 INSERT 문 또는 COPY로 삽입합니다 (커밋은 호출자가 담당)."""
+        if len(rows) < self.COPY_THRESHOLD:
+            # 소량 레코드는 COPY 준비 비용보다 준비된 INSERT 문이 빠름
+            self._execute_prepared(cur, rows)
+        else:
+            # 대량 레코드는 COPY FROM STDIN으로 한 번에 전송
+            if binary:
+                self._copy_rows_binary(cur, rows)
+            else:
+                self._copy_rows(cur, rows)
+
+    def insert_records(self, records_list: List[WorkoutRecord], binary: bool = False,
+                       raise_errors: bool = False) -> int:
+        """
+        WorkoutRecord 객체 목록을 PostgreSQL의 'records' 테이블에 삽입
+        binary=True이면 대량 삽입 시 COPY BINARY 형식을 사용 (정수 컬럼이 int4여야 함)
+        raise_errors=True이면 실패 시 0 대신 (롤백 후) 원래 예외를 발생
+        """
+        # WorkoutRecord 객체 리스트를 DB 삽입을 위한 튜플 리스트로 변환
+        return self.insert_records_tuples(list(map(record_as_tuple, records_list)), binary, raise_errors)
+
+    def insert_records_tuples(self, rows: List[tuple], binary: bool = False, raise_errors: bool = False) -> int:
+        """
+        (record_date, exercise_type, weight, reps, sets) 튜플 목록을 'records' 테이블에 삽입
+        WorkoutRecord 객체를 거치지 않는 대량 삽입 경로에서 사용
+        """
+        if not rows: # 삽입할 레코드가 없으면 0 반환
+            log.debug("삽입할 레코드가 없습니다.")
+            return 0
+        # 전체를 하나의 청크로 넘겨 행 개수 기준의 준비된 INSERT / COPY 선택을 그대로 유지
+        return self.insert_records_stream(rows, chunk_size=len(rows), binary=binary, raise_errors=raise_errors)
+
+    def insert_records_stream(self, rows: Iterable[tuple], chunk_size: int = 500, binary: bool = False,
+                              raise_errors: bool = False) -> int:
+        """
+        튜플 이터러블을 chunk_size개씩 나누어 삽입합니다.
+        전체를 하나의 연결, 하나의 커서, 하나의 트랜잭션으로 처리하며 마지막에 한 번만 커밋합니다.
+        raise_errors=True이면 실패 시 0 대신 (롤백 후) 원래 예외를 발생 (연결 실패는 OperationalError)
         """
-        cur = None # 커서 객체 초기화
         inserted_count = 0 # 삽입된 레코드 수 초기화
-        try:
-            cur = self._get_cursor() # 커서 가져오기
-            if cur:
-                print(f"PostgreSQL에 {len(records_list)}개의 레코드 삽입 중...")
-                # WorkoutRecord 객체 리스트를 DB 삽입을 위한 튜플 리스트로 변환
-                data_to_insert = [record.to_tuple() for record in records_list]
-                # executemany를 사용하여 여러 레코드를 한 번에 효율적으로 삽입
-                cur.executemany(insert_sql, data_to_insert)
-                self._conn.commit() # 변경사항 커밋 (실제 DB에 반영)
-                inserted_count = len(records_list) # 삽입 성공한 레코드 수 (executemany는 성공 시 전체 수를 반환)
-                print(f"{inserted_count}개의 레코드 삽입 완료.")
-        except psycopg2.Error as e:
-            print(f"데이터베이스 삽입 오류 발생: {e}")
-            if self._conn:
-                self._conn.rollback() # 오류 발생 시 롤백 (변경사항 취소)
-                print("PostgreSQL 변경사항 롤백됨.")
-            print(f"데이터베이스 오류 상세 정보: {e.pgerror}") # 상세 오류 메시지 출력
-        except Exception as e:
-            print(f"삽입 중 알 수 없는 오류 발생: {e}")
-        finally:
-            if cur:
-                cur.close() # 커서 닫기
+        with self._acquire() as conn:
+            # 삽입 전에 데이터베이스 연결 확인/재연결
+            if conn is None:
+                log.error("데이터베이스 연결 실패로 삽입을 진행할 수 없습니다.")
+                if raise_errors:
+                    raise psycopg2.OperationalError("Could not get a database connection for insert")
+                return 0
+            try:
+                with conn.cursor() as cur:
+                    row_iter = iter(rows)
+                    # 이터러블 전체를 메모리에 올리지 않고 chunk_size개씩 가져와 삽입
+                    while chunk := list(islice(row_iter, chunk_size)):
+                        self._write_rows(cur, chunk, binary)
+                        inserted_count += len(chunk)
+                conn.commit() # 모든 청크를 한 번에 커밋
+                log.debug("%d개의 레코드 삽입 완료.", inserted_count)
+            except psycopg2.Error as e:
+                _rollback(conn) # 오류 발생 시 전체 롤백 (일부 청크만 반영되지 않도록)
+                log.error("데이터베이스 삽입 오류 발생 (롤백됨): %s / 상세 정보: %s", e, e.pgerror)
+                if raise_errors:
+                    raise
+                inserted_count = 0
+            except Exception as e:
+                _rollback(conn)
+                log.exception("삽입 중 알 수 없는 오류 발생: %s", e)
+                if raise_errors:
+                    raise
+                inserted_count = 0
         return inserted_count # 삽입된 레코드 수 반환
 
     def fetch_records(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """쿼리를 사용하여 PostgreSQL에서 기록을 가져옵니다."""
-        # 조회 전에 데이터베이스 연결 확인/재연결
-        if not self.connect():
-            print("데이터베이스 연결 실패로 조회를 진행할 수 없습니다.")
-            return [] # 연결 실패 시 빈 목록 반환
+        with self._acquire() as conn:
+            # 조회 전에 데이터베이스 연결 확인/재연결
+            if conn is None:
+                log.error("데이터베이스 연결 실패로 조회를 진행할 수 없습니다.")
+                return [] # 연결 실패 시 빈 목록 반환
+            try:
+                # RealDictCursor가 결과 행을 바로 딕셔너리로 만들어 줌 (컬럼 이름 포함)
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute(query, params) # SQL 쿼리 실행
+                    results = cur.fetchall() # 모든 결과 행 가져오기
+                    log.debug("쿼리 결과 %d개 레코드 조회.", len(results))
+                    return results # 조회된 레코드 목록 반환
+            except psycopg2.Error as e:
+                log.error("PostgreSQL 조회 오류 발생: %s / 상세 정보: %s", e, e.pgerror) # 상세 오류 메시지 포함
+                _rollback(conn)
+            except Exception as e:
+                log.exception("조회 중 알 수 없는 오류 발생: %s", e)
+        return []
 
-        cur = None # 커서 객체 초기화
-        try:
-            cur = self._get_cursor() # 커서 가져오기
-            if cur:
-                cur.execute(query, params) # SQL 쿼리 실행
-                # 결과를 딕셔너리 리스트로 변환 (컬럼 이름 포함)
-                columns = [desc[0] for desc in cur.description] # 컬럼 이름 가져오기
-                results = []
-                for row in cur.fetchall(): # 모든 결과 행 가져오기
-                    results.append(dict(zip(columns, row))) # 컬럼 이름과 행 데이터를 딕셔너리로 묶어 추가
-                print(f"쿼리 결과 {len(results)}개 레코드 조회.")
-                return results # 조회된 레코드 목록 반환
-        except psycopg2.Error as e:
-            print(f"PostgreSQL 조회 오류 발생: {e}")
-            print(f"PostgreSQL 오류 상세 정보: {e.pgerror}") # 상세 오류 메시지 출력
-        except Exception as e:
-            print(f"조회 중 알 수 없는 오류 발생: {e}")
-        finally:
-            if cur:
-                cur.close() # 커서 닫기
-            # 연결은 유지
-        return []
\ No newline at end of file
+    def stream_records(self, query: str, params: tuple = None) -> Iterator[Dict[str, Any]]:
+        """서버 측(named) 커서로 쿼리 결과를 나누어 가져오며 한 행씩 딕셔너리로 반환합니다."""
+        # 연결은 스트리밍이 끝나거나 중단될 때(제너레이터 종료) 반납됨
+        with self._acquire() as conn:
+            # 조회 전에 데이터베이스 연결 확인/재연결
+            if conn is None:
+                # 빈 결과와 구분되도록 호출자에게 오류 발생
+                raise psycopg2.OperationalError("Could not get a database connection for streaming")
+            try:
+                # 이름 있는 커서는 서버에 결과를 두고 STREAM_ITERSIZE 행씩 가져옴
+                # RealDictCursor가 행을 바로 딕셔너리로 만들어 줌
+                with conn.cursor(name='stream_records', cursor_factory=RealDictCursor) as cur:
+                    cur.itersize = self.STREAM_ITERSIZE
+                    cur.execute(query, params) # SQL 쿼리 실행
+                    yield from cur
+            except psycopg2.Error as e:
+                log.error("PostgreSQL 조회 오류 발생: %s / 상세 정보: %s", e, e.pgerror) # 상세 오류 메시지 포함
+                _rollback(conn)
+                raise # 잘린 결과나 빈 결과가 정상 응답으로 끝나지 않도록 호출자에게 다시 발생
+            except Exception as e:
+                log.exception("조회 중 알 수 없는 오류 발생: %s", e)
+                raise
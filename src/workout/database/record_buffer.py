@@ -0,0 +1,113 @@
+# src/workout/database/record_buffer.py
+import logging
+import threading
+from collections import deque
+from typing import List, Deque, Optional
+
+import psycopg2
+
+from ..abstracts import AbstractDatabaseManager
+from ..models import WorkoutRecord
+
+log = logging.getLogger(__name__)
+
+# 다시 시도하면 성공할 수 있는 오류 (연결 끊김, 서버 재시작, 연결 실패 등)
+# 그 밖의 오류(int4 범위 초과 같은 데이터 오류)는 같은 기록으로 재시도해도 계속 실패함
+_TRANSIENT_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class RecordBuffer:
+    """
+    API로 들어온 기록을 메모리에 모아 두었다가 한 번에 삽입하는 버퍼.
+    flush_size개가 쌓이거나 flush_interval초가 지나면 백그라운드 스레드가 저장합니다.
+    연결 오류로 저장에 실패한 기록은 버퍼 앞쪽에 다시 넣어 다음 저장 때 재시도하며, 버퍼는 max_size개를 넘지 않습니다.
+    데이터 오류로 실패하면 한 건씩 다시 저장하여 저장할 수 없는 기록만 버립니다 (다른 기록을 막지 않도록).
+    """
+
+    def __init__(self, db_manager: AbstractDatabaseManager, flush_size: int = 1000, flush_interval: float = 0.5,
+                 max_size: Optional[int] = None):
+        self._db_manager = db_manager # 스레드 간에 공유 가능한 (연결 풀 기반) 데이터베이스 관리자
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._max_size = max_size if max_size is not None else flush_size * 10 # DB 장애 시 메모리 사용 상한
+        self._buf: Deque[WorkoutRecord] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event() # flush_size 도달 시 백그라운드 스레드를 바로 깨움
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="record-buffer-flusher", daemon=True)
+        self._thread.start()
+
+    def add(self, records: List[WorkoutRecord]) -> bool:
+        """기록을 버퍼에 추가합니다 (실제 저장은 비동기). 버퍼가 가득 차 있으면 추가하지 않고 False 반환."""
+        with self._lock:
+            if len(self._buf) + len(records) > self._max_size:
+                return False
+            self._buf.extend(records)
+            should_flush = len(self._buf) >= self._flush_size
+        if should_flush:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 기록을 모두 데이터베이스에 삽입하고 삽입된 수를 반환합니다."""
+        with self._lock:
+            if not self._buf:
+                return 0
+            batch = list(self._buf)
+            self._buf.clear()
+
+        try:
+            return self._db_manager.insert_records(batch, raise_errors=True)
+        except _TRANSIENT_ERRORS as e:
+            # insert_records 내부에서 오류 로깅이 되었으므로 재시도 대상 개수만 출력
+            log.error("버퍼 저장 실패 (%s): %d개의 레코드를 다음 저장 때 재시도합니다.", e, len(batch))
+            self._requeue(batch)
+            return 0
+        except Exception as e:
+            log.error("버퍼 일괄 저장 실패 (%s): %d개의 레코드를 한 건씩 저장합니다.", e, len(batch))
+            return self._insert_one_by_one(batch)
+
+    def _insert_one_by_one(self, batch: List[WorkoutRecord]) -> int:
+        """기록을 한 건씩 삽입하여 저장할 수 없는 기록만 버립니다. 연결 오류가 나면 남은 기록을 다시 버퍼에 넣습니다."""
+        inserted_count = 0
+        for i, record in enumerate(batch):
+            try:
+                inserted_count += self._db_manager.insert_records([record], raise_errors=True)
+            except _TRANSIENT_ERRORS as e:
+                log.error("버퍼 저장 실패 (%s): %d개의 레코드를 다음 저장 때 재시도합니다.", e, len(batch) - i)
+                self._requeue(batch[i:])
+                break
+            except Exception as e:
+                log.error("저장할 수 없는 레코드를 버립니다 (%s): %r", e, record)
+        return inserted_count
+
+    def _requeue(self, batch: List[WorkoutRecord]):
+        """저장에 실패한 기록을 순서를 유지한 채 버퍼 앞쪽에 다시 넣습니다 (상한 초과분은 오래된 것부터 버림)."""
+        with self._lock:
+            self._buf.extendleft(reversed(batch))
+            dropped = 0
+            while len(self._buf) > self._max_size:
+                self._buf.popleft()
+                dropped += 1
+        if dropped:
+            log.error("버퍼 상한(%d개) 초과: %d개의 레코드가 저장되지 않고 버려졌습니다.", self._max_size, dropped)
+
+    def close(self):
+        """백그라운드 스레드를 멈추고 남은 기록을 저장합니다."""
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+        # 종료 시에는 다음 저장이 없으므로 다시 넣어진 기록은 유실됨
+        with self._lock:
+            lost = len(self._buf)
+            self._buf.clear()
+        if lost:
+            log.error("종료 시 저장 실패: %d개의 레코드가 저장되지 않고 버려졌습니다.", lost)
+
+    def _run(self):
+        """flush_interval마다 (또는 깨워질 때) 버퍼를 비우는 백그라운드 루프."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self.flush()
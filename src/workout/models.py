@@ -1,4 +1,6 @@
 # src/workout_importer/models.py
+from dataclasses import dataclass
+from operator import attrgetter
 from datetime import date
 from typing import Optional, Dict, Any
 
@@ -8,26 +10,23 @@ def estimate_1rm_epley(weight: Optional[int], reps: Optional[int]) -> Optional[i
     # 중량이나 횟수가 유효하지 않으면 None 반환
     if weight is None or reps is None or weight <= 0 or reps < 0:
         return None
-    # Epley 공식 계산 후 정수로 반올림
-    estimated_1rm = round(weight * (1 + reps / 30))
-    return int(estimated_1rm)
+    # Epley 공식 weight * (1 + reps / 30)을 정수 연산으로 0.5 올림(half-up) 반올림
+    # (DB 생성 컬럼 migrations/002의 numeric round와 같은 결과 - float round()는 .5를 짝수 쪽으로 반올림하므로 사용하지 않음)
+    return (weight * (30 + reps) * 2 + 30) // 60
 
+@dataclass(slots=True)
 class WorkoutRecord:
-    """하나의 운동 세트 기록을 나타냅니다."""
-    def __init__(self,
-                 record_date: date,
-                 exercise_type: str,
-                 weight: Optional[int],
-                 reps: Optional[int],
-                 sets: Optional[int],
-                 estimated_1rm: Optional[int] = None):
-        self.record_date = record_date
-        self.exercise_type = exercise_type
-        self.weight = weight
-        self.reps = reps
-        self.sets = sets
-        # estimated_1rm이 None이면 자동으로 계산하여 할당
-        self.estimated_1rm = estimated_1rm if estimated_1rm is not None else estimate_1rm_epley(self.weight, self.reps)
+    """하나의 운동 세트 기록을 나타냅니다. (__slots__로 인스턴스별 __dict__ 없이 저장)"""
+    record_date: date
+    exercise_type: str
+    weight: Optional[int]
+    reps: Optional[int]
+    sets: Optional[int]
+
+    @property
+    def estimated_1rm(self) -> Optional[int]:
+        """추정 1RM (DB에서는 생성 컬럼으로 계산되며, 여기서는 응답용으로만 계산)"""
+        return estimate_1rm_epley(self.weight, self.reps)
 
     def __repr__(self) -> str:
         # 객체를 문자열로 표현할 때 사용
@@ -46,5 +45,9 @@ class WorkoutRecord:
         }
 
     def to_tuple(self) -> tuple:
-        """데이터베이스 삽입을 위해 기록을 튜플 형태로 변환합니다."""
-        return (self.record_date, self.exercise_type, self.weight, self.reps, self.sets, self.estimated_1rm)
\ No newline at end of file
+        """데이터베이스 삽입을 위해 기록을 튜플 형태로 변환합니다 (estimated_1rm은 DB에서 생성)."""
+        return record_as_tuple(self)
+
+
+# WorkoutRecord -> 삽입용 튜플 변환 함수 (C 구현 attrgetter로 한 번에 튜플 생성, 대량 삽입 시 map과 함께 사용)
+record_as_tuple = attrgetter('record_date', 'exercise_type', 'weight', 'reps', 'sets')
@@ -1,8 +1,11 @@
 import os
+from waitress import serve
 from src.workout.api.app import create_app
 
-# 이 파일을 직접 실행했을 때 (개발 서버 시작)
+# 이 파일을 직접 실행했을 때 (멀티스레드 WSGI 서버 시작)
 if __name__ == '__main__':
     env_config_name = os.environ.get('FLASK_CONFIG', 'development')
     app = create_app(env_config_name)
-    app.run(host='0.0.0.0', port=5000)
+    # 요청 스레드 수를 POOL_MAX_CONN에 맞춤 - 요청당 연결 하나만 빌리므로 풀이 고갈되지 않음
+    # (버퍼 사용 시 백그라운드 저장 스레드 몫은 create_app에서 풀에 따로 1개 추가)
+    serve(app, host='0.0.0.0', port=5000, threads=app.config['POOL_MAX_CONN'])
@@ -1,13 +1,46 @@
 # src/workout_importer/services/workout_service.py
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator, Optional
 from datetime import date
+from itertools import chain
+import sys
+import fastjsonschema
 # 필요한 클래스 임포트 (workout_routes.py에서 이동)
 from ..models import WorkoutRecord
 from ..abstracts import AbstractDatabaseManager
+from ..database.record_buffer import RecordBuffer
 
 # 유효성 검사 관련 상수 (workout_routes.py에서 이동)
-ALLOWED_EXERCISE_TYPES = ['벤치프레스', '데드리프트', '스쿼트']
+ALLOWED_EXERCISE_TYPES = frozenset(map(sys.intern, ('벤치프레스', '데드리프트', '스쿼트')))
+# 허용되지 않은 종목 오류 메시지 템플릿 (요청마다 join 하지 않도록 미리 생성)
+_PADDED_ERR = "Invalid exercise type: '%s'. Leading or trailing whitespace is not allowed."
+_ALLOWED_ERR = f"Invalid exercise type: '%s'. Allowed types are: {', '.join(sorted(ALLOWED_EXERCISE_TYPES))}"
+
+# 입력 값 상한 (int4 컬럼과 estimated_1rm 생성 컬럼 계산이 넘치지 않는 현실적인 범위)
+MAX_WEIGHT = 1000
+MAX_REPS = 1000
+MAX_SETS = 1000
+
+# 운동 기록 입력 스키마 (모듈 로드 시 한 번 컴파일되어 전용 검증 코드가 생성됨)
+_validate_workout_schema = fastjsonschema.compile({
+    "type": "object",
+    "required": ["exercise_type", "weight", "reps", "sets"],
+    "properties": {
+        "exercise_type": {"type": "string", "enum": sorted(ALLOWED_EXERCISE_TYPES)},
+        "weight": {"type": "integer", "minimum": 0, "maximum": MAX_WEIGHT},
+        "reps": {"type": "integer", "minimum": 0, "maximum": MAX_REPS},
+        "sets": {"type": "integer", "minimum": 1, "maximum": MAX_SETS},
+    },
+})
+
+# 전체 운동 기록 조회 쿼리 (마지막 정렬 키 id로 순서를 고정하여 페이지 간 중복/누락 방지)
+ALL_RECORDS_QUERY = "SELECT * FROM records ORDER BY record_date DESC, sets ASC, id ASC"
+# 페이지 단위 조회 쿼리 (idx_records_date_sets 인덱스를 사용)
+PAGED_RECORDS_QUERY = ALL_RECORDS_QUERY + " LIMIT %s OFFSET %s"
+
+# 페이지 크기 기본값 및 상한
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
 # 서비스 계층에서 발생할 수 있는 커스텀 예외 정의 (선택 사항, 오류 처리를 더 명확하게 함)
 class ValidationError(Exception):
@@ -18,74 +51,62 @@ class DatabaseServiceError(Exception):
     """서비스 계층에서 데이터베이스 관련 오류 발생 시 발생하는 예외"""
     pass
 
+class ServiceUnavailableError(DatabaseServiceError):
+    """일시적으로 요청을 받을 수 없을 때 (예: 일괄 저장 버퍼가 가득 참) 발생하는 예외"""
+    pass
+
 
 # 운동 기록 관련 비즈니스 로직을 처리하는 서비스 클래스
 class WorkoutService:
-    def __init__(self, db_manager: AbstractDatabaseManager):
-        # 서비스는 데이터베이스 관리자 인스턴스를 의존성으로 주입받습니다.
+    def __init__(self,
+                 db_manager: AbstractDatabaseManager,
+                 record_buffer: Optional[RecordBuffer] = None):
+        # 서비스는 (스레드 간에 공유 가능한) 데이터베이스 관리자를 의존성으로 주입받습니다.
+        # 요청별 상태를 갖지 않으므로 앱 당 하나의 인스턴스를 재사용할 수 있습니다.
         self.db_manager = db_manager
+        # 설정된 경우 기록을 바로 저장하지 않고 버퍼에 모아 일괄 저장
+        self.record_buffer = record_buffer
 
-    def validate_workout_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """입력 데이터를 검증하고 정제합니다."""
-        required_fields = ['exercise_type', 'weight', 'reps', 'sets']
-        if not data or not all(field in data for field in required_fields):
-            raise ValidationError("Missing required fields")
-
-        exercise_type = data.get('exercise_type')
-        weight = data.get('weight')
-        reps = data.get('reps')
-        sets = data.get('sets')
-
-        # 운동 종목 유효성 검사 및 표준화
-        if not isinstance(exercise_type, str):
-             raise ValidationError("Invalid data type for exercise_type. Must be a string.")
-        exercise_type = exercise_type.strip()
-        if exercise_type not in ALLOWED_EXERCISE_TYPES:
-             raise ValidationError(f"Invalid exercise type: '{exercise_type}'. Allowed types are: {', '.join(ALLOWED_EXERCISE_TYPES)}")
-
-        # 숫자 타입 변환 및 유효성 검사
+    def validate_workout_data(self, data: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
+        """입력 데이터를 검증하고 정제합니다. today를 주면 기록 날짜로 사용합니다 (일괄 처리 시 한 번만 계산)."""
         try:
-            if weight is None or reps is None or sets is None:
-                 raise TypeError("Weight, reps, or sets is None") # 이 경우는 required_fields 체크에서 걸릴 가능성 높음
-
-            numeric_weight = int(weight)
-            numeric_reps = int(reps)
-            numeric_sets = int(sets)
-
-            if numeric_weight < 0 or numeric_reps < 0 or numeric_sets <= 0:
-                 raise ValidationError("Weight, reps must be non-negative, sets must be positive")
-
-        except (ValueError, TypeError) as e:
-             raise ValidationError(f"Invalid data type for weight, reps, or sets. Must be integers. Details: {e}")
-        except Exception as e:
-             raise DatabaseServiceError(f"An unexpected error occurred during validation. Details: {e}") # 예상치 못한 오류는 서비스 오류로 처리
+            _validate_workout_schema(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            if e.name == 'data.exercise_type' and e.rule == 'enum':
+                # 입력은 정규화된 문자열이어야 함 (strip 할당 없이 그대로 비교, 오류 경로에서만 원인 안내)
+                if e.value.strip() in ALLOWED_EXERCISE_TYPES:
+                    raise ValidationError(_PADDED_ERR % e.value)
+                raise ValidationError(_ALLOWED_ERR % e.value)
+            raise ValidationError(e.message)
 
         # 검증된 데이터 반환
         return {
-            'exercise_type': exercise_type,
-            'weight': numeric_weight,
-            'reps': numeric_reps,
-            'sets': numeric_sets,
-            'record_date': date.today() # 서비스 계층에서 날짜 결정
+            'exercise_type': data['exercise_type'],
+            'weight': int(data['weight']), # 1.0 같은 정수 값 실수도 정수로 통일
+            'reps': int(data['reps']),
+            'sets': int(data['sets']),
+            'record_date': today or date.today() # 서비스 계층에서 날짜 결정
         }
 
 
+    def _build_record(self, raw_data: Dict[str, Any], today: Optional[date] = None) -> WorkoutRecord:
+        """입력 데이터를 검증하여 WorkoutRecord 객체를 생성합니다."""
+        validated_data = self.validate_workout_data(raw_data, today)
+        return WorkoutRecord(
+            record_date=validated_data['record_date'],
+            exercise_type=validated_data['exercise_type'],
+            weight=validated_data['weight'],
+            reps=validated_data['reps'],
+            sets=validated_data['sets']
+        )
+
     def add_record(self, raw_data: Dict[str, Any]) -> WorkoutRecord:
         """새로운 운동 기록을 검증하고 데이터베이스에 저장합니다."""
         try:
-            # 1. 데이터 유효성 검사 및 정제
-            validated_data = self.validate_workout_data(raw_data)
-
-            # 2. WorkoutRecord 객체 생성
-            new_record = WorkoutRecord(
-                record_date=validated_data['record_date'],
-                exercise_type=validated_data['exercise_type'],
-                weight=validated_data['weight'],
-                reps=validated_data['reps'],
-                sets=validated_data['sets']
-            )
-
-            # 3. 데이터베이스에 저장
+            # 1. 데이터 유효성 검사 및 WorkoutRecord 객체 생성
+            new_record = self._build_record(raw_data)
+
+            # 2. 데이터베이스에 저장
             records_to_insert: List[WorkoutRecord] = [new_record]
             inserted_count = self.db_manager.insert_records(records_to_insert)
 
@@ -93,7 +114,7 @@ class WorkoutService:
                 # insert_records 내부에서 오류 로깅이 되었을 것이므로, 여기서는 서비스 오류 발생
                 raise DatabaseServiceError("Failed to save workout record to database")
 
-            # 4. 성공 시 저장된 레코드 객체 반환
+            # 3. 성공 시 저장된 레코드 객체 반환
             return new_record
 
         except ValidationError as e:
@@ -103,11 +124,68 @@ class WorkoutService:
             # 유효성 검사 외 다른 오류는 서비스 오류로 처리
             raise DatabaseServiceError(f"An unexpected error occurred in service layer: {e}")
 
+    def add_records(self, raw_data_list: List[Dict[str, Any]]) -> List[WorkoutRecord]:
+        """여러 운동 기록을 모두 검증한 뒤 한 번의 삽입(트랜잭션)으로 저장합니다."""
+        if not isinstance(raw_data_list, list) or not raw_data_list:
+            raise ValidationError("Request body must be a non-empty list of workout records")
+
+        # 1. 전체 기록을 먼저 검증하고, 실패한 항목은 인덱스와 함께 모아서 보고
+        new_records: List[WorkoutRecord] = []
+        errors: List[str] = []
+        today = date.today() # 같은 요청의 기록은 모두 같은 날짜 (루프 밖에서 한 번만 계산)
+        for index, raw_data in enumerate(raw_data_list):
+            try:
+                new_records.append(self._build_record(raw_data, today))
+            except ValidationError as e:
+                errors.append(f"[{index}] {e}")
+        if errors:
+            raise ValidationError("; ".join(errors))
+
+        try:
+            # 2. 검증된 기록 전체를 한 번에 데이터베이스에 저장
+            inserted_count = self.db_manager.insert_records(new_records)
+            if inserted_count == 0:
+                raise DatabaseServiceError("Failed to save workout records to database")
+            return new_records
+
+        except DatabaseServiceError as e:
+            raise e
+        except Exception as e:
+            raise DatabaseServiceError(f"An unexpected error occurred in service layer: {e}")
+
+    def queue_record(self, raw_data: Dict[str, Any]) -> WorkoutRecord:
+        """새로운 운동 기록을 검증하고 일괄 저장 버퍼에 추가합니다."""
+        if self.record_buffer is None:
+            raise DatabaseServiceError("Buffered inserts are not enabled")
+        new_record = self._build_record(raw_data)
+        if not self.record_buffer.add([new_record]):
+            raise ServiceUnavailableError("Record buffer is full; try again later")
+        return new_record
+
 
     def get_all_records(self) -> List[Dict[str, Any]]:
         """데이터베이스에 저장된 모든 운동 기록 목록을 조회합니다."""
-        query = "SELECT * FROM records ORDER BY record_date DESC, sets ASC"
+        query = ALL_RECORDS_QUERY
         # db_manager.fetch_records 내부에서 오류 처리 및 로깅이 이루어지므로, 여기서는 결과만 반환
         records_data = self.db_manager.fetch_records(query)
         return records_data
 
+    def stream_records_page(self, limit: Any = DEFAULT_PAGE_SIZE, offset: Any = 0) -> Iterator[Dict[str, Any]]:
+        """최신순으로 정렬된 운동 기록 중 한 페이지를 한 행씩 조회합니다."""
+        try:
+            limit = int(limit)
+            offset = int(offset)
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid pagination parameters. limit and offset must be integers.")
+        if not 1 <= limit <= MAX_PAGE_SIZE or offset < 0:
+            raise ValidationError(f"limit must be between 1 and {MAX_PAGE_SIZE}, offset must be non-negative")
+        rows = self.db_manager.stream_records(PAGED_RECORDS_QUERY, (limit, offset))
+        # 첫 행을 미리 가져와 연결/쿼리 오류가 응답 시작 전에 DatabaseServiceError(500)로 드러나게 함
+        # (스트리밍이 시작된 뒤의 오류는 그대로 발생하여 응답이 중단됨)
+        try:
+            first_row = next(rows, None)
+        except Exception as e:
+            raise DatabaseServiceError(f"Failed to fetch workout records: {e}")
+        if first_row is None:
+            return iter(())
+        return chain((first_row,), rows)
@@ -0,0 +1,120 @@
+import psycopg2
+import pytest
+
+import src.workout.api.app as app_module
+
+
+class FakeCursor:
+    """psycopg2 커서 대신 실행된 SQL을 기록하는 테스트용 커서."""
+
+    def __init__(self, conn, name=None):
+        self.conn = conn
+        self.name = name
+        self.itersize = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        self.conn.maybe_fail(sql)
+
+    def mogrify(self, sql, args):
+        # execute_batch가 여러 문장을 하나로 합칠 때 사용
+        return (sql % tuple(repr(a) for a in args)).encode()
+
+    def copy_expert(self, sql, file):
+        self.conn.copied.append((sql, file.read()))
+        self.conn.maybe_fail(sql)
+
+    def fetchall(self):
+        return list(self)
+
+    def __iter__(self):
+        for row in self.conn.rows:
+            if isinstance(row, Exception):
+                raise row # 스트리밍 도중 발생하는 오류 흉내
+            yield row
+
+
+class FakeConnection:
+    """commit/rollback 횟수와 실행된 SQL을 기록하는 테스트용 연결."""
+
+    def __init__(self):
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed = []
+        self.copied = []
+        self.rows = []
+        self.fail_on = None # 이 문자열을 포함한 SQL 실행 시 fail_with 예외 발생
+        self.fail_with = None
+
+    def maybe_fail(self, sql):
+        text = sql.decode() if isinstance(sql, bytes) else sql
+        if self.fail_on is not None and self.fail_on in text:
+            if isinstance(self.fail_with, psycopg2.OperationalError):
+                self.closed = 2 # 서버가 끊은 연결은 psycopg2가 closed로 표시
+            raise self.fail_with
+
+    def cursor(self, name=None, cursor_factory=None):
+        return FakeCursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        self.rollbacks += 1
+
+
+class FakePool:
+    """연결 하나를 빌려주고 돌려받는 테스트용 연결 풀."""
+
+    def __init__(self, minconn=1, maxconn=1, **kwargs):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.conn = FakeConnection()
+        self.closed = False
+        self.returned = 0
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        self.returned += 1
+
+    def closeall(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    return FakePool()
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """실제 DB 대신 FakePool을 사용하는 앱 (풀은 app.extensions['db_pool'])."""
+    monkeypatch.setattr(app_module, "ThreadedConnectionPool", FakePool)
+    return app_module.create_app("default")
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def buffered_app(monkeypatch):
+    """BUFFERED_INSERTS가 켜진 앱 (백그라운드 저장은 사실상 일어나지 않도록 간격을 길게 설정)."""
+    monkeypatch.setattr(app_module, "ThreadedConnectionPool", FakePool)
+    config = app_module.config_by_name["default"]
+    monkeypatch.setattr(config, "BUFFERED_INSERTS", True)
+    monkeypatch.setattr(config, "BUFFER_FLUSH_INTERVAL", 3600)
+    monkeypatch.setattr(config, "BUFFER_MAX_SIZE", 1)
+    return app_module.create_app("default")
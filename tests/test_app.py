@@ -0,0 +1,66 @@
+from datetime import date
+
+import psycopg2
+import psycopg2.errors
+
+
+def test_create_app_uses_pool(app):
+    pool = app.extensions["db_pool"]
+    assert pool.maxconn == app.config["POOL_MAX_CONN"]
+    assert app.extensions["db_manager"]._pool is pool
+
+
+def test_post_workout(client, app):
+    response = client.post("/workouts/", json={"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1})
+    assert response.status_code == 201
+    assert response.get_json()["estimated_1rm_for_set"] == 117
+    executed = [sql for sql, _ in app.extensions["db_pool"].conn.executed]
+    assert any(b"EXECUTE ins_record" in sql for sql in executed if isinstance(sql, bytes))
+
+
+def test_post_workout_batch(client):
+    response = client.post("/workouts/batch", json=[
+        {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1},
+        {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 2},
+    ])
+    assert response.status_code == 201
+    assert response.get_json()["estimated_1rm_for_sets"] == [117, 117]
+
+
+def test_get_workouts(client, app):
+    row = {"id": 1, "record_date": date(2024, 1, 2), "exercise_type": "스쿼트",
+           "weight": 100, "reps": 5, "sets": 1, "estimated_1rm": 117}
+    app.extensions["db_pool"].conn.rows = [row]
+    response = client.get("/workouts/")
+    assert response.status_code == 200
+    assert response.get_json() == [dict(row, record_date="2024-01-02")]
+
+
+def test_post_workout_out_of_range_is_400(client, app):
+    response = client.post("/workouts/", json={"exercise_type": "스쿼트", "weight": 10**12, "reps": 5, "sets": 1})
+    assert response.status_code == 400
+    assert app.extensions["db_pool"].conn.executed == [] # DB까지 가지 않음
+
+
+def test_get_workouts_db_error_is_500(client, app):
+    conn = app.extensions["db_pool"].conn
+    conn.fail_on = "SELECT"
+    conn.fail_with = psycopg2.errors.UndefinedColumn("column \"id\" does not exist")
+    response = client.get("/workouts/")
+    assert response.status_code == 500
+
+
+def test_get_workouts_empty(client):
+    response = client.get("/workouts/")
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+def test_buffered_post_returns_503_when_buffer_is_full(buffered_app):
+    client = buffered_app.test_client()
+    payload = {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1}
+    first = client.post("/workouts/", json=payload)
+    assert first.status_code == 202
+    assert "job_id" not in first.get_json()
+    assert buffered_app.extensions["db_pool"].maxconn == buffered_app.config["POOL_MAX_CONN"] + 1
+    assert client.post("/workouts/", json=payload).status_code == 503
@@ -0,0 +1,26 @@
+from datetime import date
+
+from flask import Flask
+
+from src.workout.api.json_provider import ORJSONProvider
+
+
+def _provider(**attrs):
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    for key, value in attrs.items():
+        setattr(app.json, key, value)
+    return app.json
+
+
+def test_dumps_sorts_keys_by_default():
+    assert _provider().dumps({"b": 1, "a": date(2024, 1, 2)}) == '{"a":"2024-01-02","b":1}'
+
+
+def test_dumps_respects_sort_keys_setting():
+    assert _provider(sort_keys=False).dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+    assert _provider().dumps({"b": 1, "a": 2}, sort_keys=False) == '{"b":1,"a":2}'
+
+
+def test_dumps_indent():
+    assert _provider().dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
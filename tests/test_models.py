@@ -0,0 +1,23 @@
+import pytest
+
+from src.workout.models import estimate_1rm_epley
+
+
+# 기대값은 PostgreSQL round(weight::NUMERIC * (30 + reps) / 30) (migrations/002)과 같은 half-up 결과
+@pytest.mark.parametrize("weight, reps, expected", [
+    (75, 15, 113),  # 112.5 -> 113 (half-up)
+    (15, 15, 23),   # 22.5 -> 23
+    (9, 5, 11),     # 10.5 -> 11
+    (3, 25, 6),     # 5.5 -> 6 (reps / 30.0을 먼저 나누면 5.4999...로 잘리는 경우)
+    (100, 1, 103),  # 103.33 -> 103
+    (100, 5, 117),
+    (60, 0, 60),
+    (1000, 1000, 34333),
+])
+def test_estimate_1rm_epley_rounds_half_up(weight, reps, expected):
+    assert estimate_1rm_epley(weight, reps) == expected
+
+
+@pytest.mark.parametrize("weight, reps", [(None, 5), (80, None), (0, 5), (-10, 5), (80, -1)])
+def test_estimate_1rm_epley_invalid_inputs(weight, reps):
+    assert estimate_1rm_epley(weight, reps) is None
@@ -0,0 +1,122 @@
+from datetime import date
+
+import psycopg2
+import pytest
+
+from src.workout.database.postgres_manager import PostgreSQLDatabaseManager, _encode_copy_binary
+
+
+def test_encode_copy_binary_known_bytes():
+    buf = _encode_copy_binary([(date(2000, 1, 2), "스쿼트", 100, 5, None)])
+    text = "스쿼트".encode("utf-8")
+    expected = (
+        b"PGCOPY\n\xff\r\n\x00"                     # 서명
+        + b"\x00\x00\x00\x00"                       # 플래그
+        + b"\x00\x00\x00\x00"                       # 헤더 확장 길이
+        + b"\x00\x05"                               # 필드 수
+        + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x01"  # date: 2000-01-01 기준 1일
+        + len(text).to_bytes(4, "big") + text        # text
+        + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x64"  # weight 100
+        + b"\x00\x00\x00\x04" + b"\x00\x00\x00\x05"  # reps 5
+        + b"\xff\xff\xff\xff"                       # sets NULL
+        + b"\xff\xff"                               # 트레일러
+    )
+    assert buf.read() == expected
+
+
+def test_encode_copy_binary_empty():
+    assert _encode_copy_binary([]).read() == b"PGCOPY\n\xff\r\n\x00" + bytes(8) + b"\xff\xff"
+
+
+def _manager(pool):
+    return PostgreSQLDatabaseManager.from_pool(pool)
+
+
+def _drop_connection_on(pool, sql_fragment):
+    pool.conn.fail_on = sql_fragment
+    pool.conn.fail_with = psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+def test_insert_on_dropped_connection_returns_zero(pool):
+    _drop_connection_on(pool, "EXECUTE")
+    assert _manager(pool).insert_records_tuples([(date(2024, 1, 1), "스쿼트", 100, 5, 1)]) == 0
+    assert pool.conn.rollbacks == 0 # 끊어진 연결은 롤백하지 않음
+    assert pool.returned == 1
+
+
+def test_fetch_on_dropped_connection_returns_empty(pool):
+    _drop_connection_on(pool, "SELECT")
+    assert _manager(pool).fetch_records("SELECT * FROM records") == []
+
+
+def test_stream_records_reraises_mid_stream_error(pool):
+    pool.conn.rows = [{"id": 1}, psycopg2.OperationalError("server closed the connection unexpectedly")]
+    rows = _manager(pool).stream_records("SELECT * FROM records")
+    assert next(rows) == {"id": 1}
+    with pytest.raises(psycopg2.OperationalError):
+        next(rows)
+    assert pool.returned == 1
+
+
+def test_stream_records_raises_before_first_row(pool):
+    _drop_connection_on(pool, "SELECT")
+    with pytest.raises(psycopg2.OperationalError):
+        list(_manager(pool).stream_records("SELECT * FROM records"))
+
+
+def _rows(n):
+    return [(date(2024, 1, 1), "스쿼트", 100, 5, i) for i in range(n)]
+
+
+def _writes(conn):
+    """PREPARE를 제외하고 실행된 삽입 (준비된 INSERT 배치 / COPY) 목록"""
+    prepared = [sql for sql, _ in conn.executed if isinstance(sql, bytes)]
+    copies = [sql for sql, _ in conn.copied]
+    return prepared, copies
+
+
+def test_insert_records_stream_chunks_on_one_transaction(pool):
+    manager = _manager(pool)
+    threshold = manager.COPY_THRESHOLD
+    inserted = manager.insert_records_stream(iter(_rows(threshold * 2 + 1)), chunk_size=threshold)
+    assert inserted == threshold * 2 + 1
+    prepared, copies = _writes(pool.conn)
+    assert len(copies) == 2 # 가득 찬 청크 2개는 COPY
+    assert len(prepared) == 1 # 마지막 1행은 준비된 INSERT
+    assert pool.conn.commits == 2 # PREPARE 등록 커밋 + 삽입 전체에 대한 한 번의 커밋
+    assert pool.returned == 1
+
+
+def test_insert_records_stream_rolls_back_everything_on_error(pool):
+    manager = _manager(pool)
+    threshold = manager.COPY_THRESHOLD
+    # 첫 청크는 COPY로 전송된 뒤, 두 번째 (준비된 INSERT) 청크에서 실패
+    pool.conn.fail_on = "EXECUTE"
+    pool.conn.fail_with = psycopg2.DataError("integer out of range")
+    assert manager.insert_records_stream(iter(_rows(threshold * 2 - 1)), chunk_size=threshold) == 0
+    prepared, copies = _writes(pool.conn)
+    assert (len(prepared), len(copies)) == (1, 1)
+    assert pool.conn.rollbacks == 1 # 이미 보낸 첫 청크까지 전체 롤백
+    assert pool.conn.commits == 1 # PREPARE 등록 커밋만 존재
+
+
+def test_insert_records_stream_raise_errors(pool):
+    pool.conn.fail_on = "EXECUTE"
+    pool.conn.fail_with = psycopg2.DataError("integer out of range")
+    with pytest.raises(psycopg2.DataError):
+        _manager(pool).insert_records_stream(_rows(1), raise_errors=True)
+    assert pool.conn.rollbacks == 1
+
+
+@pytest.mark.parametrize("binary, copy_format", [(False, "CSV"), (True, "FORMAT BINARY")])
+def test_write_rows_switches_to_copy_at_threshold(pool, binary, copy_format):
+    manager = _manager(pool)
+    threshold = manager.COPY_THRESHOLD
+    assert manager.insert_records_tuples(_rows(threshold - 1), binary=binary) == threshold - 1
+    prepared, copies = _writes(pool.conn)
+    assert (len(prepared), len(copies)) == (1, 0)
+
+    assert manager.insert_records_tuples(_rows(threshold), binary=binary) == threshold
+    prepared, copies = _writes(pool.conn)
+    assert (len(prepared), len(copies)) == (1, 1)
+    assert copy_format in copies[0]
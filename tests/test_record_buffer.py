@@ -0,0 +1,94 @@
+import logging
+from datetime import date
+
+import psycopg2
+
+from src.workout.database.record_buffer import RecordBuffer
+from src.workout.models import WorkoutRecord
+
+BAD_WEIGHT = 10**12 # int4 범위를 넘어 DB가 항상 거부하는 값
+
+
+class _FlakyManager:
+    """처음 fail_times번은 연결 오류를 내고, BAD_WEIGHT 기록이 섞인 삽입은 항상 거부하는 테스트용 관리자."""
+
+    def __init__(self, fail_times=0):
+        self.fail_times = fail_times
+        self.inserted = []
+
+    def insert_records(self, records, raise_errors=False):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        if any(r.weight == BAD_WEIGHT for r in records):
+            raise psycopg2.DataError("integer out of range")
+        self.inserted.extend(records)
+        return len(records)
+
+
+def _records(n, start=0, weight=100):
+    return [WorkoutRecord(date(2024, 1, 1), "스쿼트", weight, 5, i) for i in range(start, start + n)]
+
+
+def _buffer(manager, **kwargs):
+    buf = RecordBuffer(manager, flush_interval=3600, **kwargs)
+    buf._stopped.set() # 백그라운드 스레드가 flush를 호출하지 않도록 바로 중지
+    buf._wakeup.set()
+    buf._thread.join()
+    return buf
+
+
+def test_failed_flush_requeues_batch_in_order():
+    manager = _FlakyManager(fail_times=1)
+    buf = _buffer(manager)
+    buf.add(_records(3))
+    assert buf.flush() == 0
+    buf.add(_records(1, start=3))
+    assert buf.flush() == 4
+    assert [r.sets for r in manager.inserted] == [0, 1, 2, 3]
+
+
+def test_rejected_record_does_not_block_the_buffer():
+    manager = _FlakyManager()
+    buf = _buffer(manager)
+    buf.add(_records(1, start=0) + _records(1, start=1, weight=BAD_WEIGHT) + _records(1, start=2))
+    assert buf.flush() == 2 # 거부된 기록만 빼고 한 건씩 저장
+    assert [r.sets for r in manager.inserted] == [0, 2]
+    buf.add(_records(1, start=3))
+    assert buf.flush() == 1 # 버려진 기록이 이후 저장을 막지 않음
+
+
+def test_connection_error_while_inserting_one_by_one_requeues_rest():
+    manager = _FlakyManager()
+    buf = _buffer(manager)
+    buf.add(_records(1, start=0, weight=BAD_WEIGHT) + _records(2, start=1))
+    manager.insert_records = _fail_after_first(manager.insert_records)
+    assert buf.flush() == 0
+    assert buf.flush() == 2
+    assert [r.sets for r in manager.inserted] == [1, 2]
+
+
+def _fail_after_first(insert_records):
+    """일괄 저장 시도(첫 호출)는 그대로 두고, 다음 호출 한 번만 연결 오류를 내는 래퍼."""
+    calls = []
+
+    def wrapper(records, raise_errors=False):
+        calls.append(records)
+        if len(calls) == 3: # 일괄 저장 실패 -> 첫 건 거부 -> 두 번째 건에서 연결 끊김
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        return insert_records(records, raise_errors)
+    return wrapper
+
+
+def test_add_refuses_when_full():
+    buf = _buffer(_FlakyManager(), flush_size=2, max_size=3)
+    assert buf.add(_records(3)) is True
+    assert buf.add(_records(1)) is False
+
+
+def test_close_reports_records_lost_at_shutdown(caplog):
+    buf = _buffer(_FlakyManager(fail_times=10))
+    buf.add(_records(2))
+    with caplog.at_level(logging.ERROR):
+        buf.close()
+    assert "2개의 레코드가 저장되지 않고 버려졌습니다" in caplog.text
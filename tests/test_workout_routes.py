@@ -0,0 +1,58 @@
+import pytest
+
+from src.workout.services.workout_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+VALID = {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1}
+
+
+def _select_params(app):
+    """마지막으로 실행된 SELECT의 (limit, offset) 파라미터"""
+    return [params for sql, params in app.extensions["db_pool"].conn.executed
+            if isinstance(sql, str) and sql.startswith("SELECT")][-1]
+
+
+def test_get_workouts_default_page(client, app):
+    assert client.get("/workouts/").status_code == 200
+    assert _select_params(app) == (DEFAULT_PAGE_SIZE, 0)
+
+
+def test_get_workouts_custom_page(client, app):
+    assert client.get(f"/workouts/?limit={MAX_PAGE_SIZE}&offset=20").status_code == 200
+    assert _select_params(app) == (MAX_PAGE_SIZE, 20)
+
+
+@pytest.mark.parametrize("query", [
+    "limit=0", f"limit={MAX_PAGE_SIZE + 1}", "offset=-1", "limit=abc", "offset=1.5",
+])
+def test_get_workouts_rejects_bad_page_params(client, app, query):
+    response = client.get(f"/workouts/?{query}")
+    assert response.status_code == 400
+    assert "message" in response.get_json()
+    assert app.extensions["db_pool"].conn.executed == [] # DB 조회 전에 거절
+
+
+def test_post_batch_reports_invalid_indexes(client, app):
+    response = client.post("/workouts/batch", json=[VALID, dict(VALID, exercise_type="벤치")])
+    assert response.status_code == 400
+    assert response.get_json()["message"].startswith("[1] ")
+    assert app.extensions["db_pool"].conn.executed == []
+
+
+def test_post_batch_requires_list(client):
+    response = client.post("/workouts/batch", json=VALID)
+    assert response.status_code == 400
+
+
+def test_http_exceptions_pass_through_generic_handler(client):
+    # 앱 전체에 등록된 Exception 핸들러가 404/405를 500으로 바꾸지 않음
+    assert client.get("/no-such-route").status_code == 404
+    assert client.put("/workouts/", json=VALID).status_code == 405
+
+
+def test_unexpected_error_is_500_json(client, app, monkeypatch):
+    def boom(*args, **kwargs):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(app.workout_service, "add_record", boom)
+    response = client.post("/workouts/", json=VALID)
+    assert response.status_code == 500
+    assert response.get_json() == {"message": "An unexpected server error occurred."}
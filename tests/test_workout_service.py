@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+
+from src.workout.services.workout_service import (
+    MAX_REPS, MAX_SETS, MAX_WEIGHT, DatabaseServiceError, ValidationError, WorkoutService,
+)
+
+
+@pytest.fixture
+def service():
+    return WorkoutService(None) # 검증만 사용하므로 DB 관리자 불필요
+
+
+def _data(**overrides):
+    data = {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1}
+    data.update(overrides)
+    return data
+
+
+def test_padded_exercise_type_reports_whitespace(service):
+    with pytest.raises(ValidationError, match="Leading or trailing whitespace is not allowed"):
+        service.validate_workout_data(_data(exercise_type=" 스쿼트"))
+
+
+def test_unknown_exercise_type_lists_allowed_types(service):
+    with pytest.raises(ValidationError) as exc_info:
+        service.validate_workout_data(_data(exercise_type="벤치"))
+    assert str(exc_info.value) == (
+        "Invalid exercise type: '벤치'. Allowed types are: 데드리프트, 벤치프레스, 스쿼트"
+    )
+
+
+def test_other_schema_errors_use_validator_message(service):
+    with pytest.raises(ValidationError, match="sets"):
+        service.validate_workout_data(_data(sets=0))
+
+
+def test_whole_floats_are_converted_to_int(service):
+    today = date(2024, 1, 1)
+    validated = service.validate_workout_data(_data(weight=100.0, reps=5.0), today=today)
+    assert validated == {"exercise_type": "스쿼트", "weight": 100, "reps": 5, "sets": 1, "record_date": today}
+    assert type(validated["weight"]) is int
+
+
+@pytest.mark.parametrize("field, value", [
+    ("weight", 10**12), ("weight", 1e300), ("reps", MAX_REPS + 1), ("sets", MAX_SETS + 1),
+])
+def test_values_above_maximum_are_rejected(service, field, value):
+    with pytest.raises(ValidationError, match=field):
+        service.validate_workout_data(_data(**{field: value}))
+
+
+def test_maximum_values_are_accepted(service):
+    validated = service.validate_workout_data(_data(weight=MAX_WEIGHT, reps=MAX_REPS, sets=MAX_SETS))
+    assert (validated["weight"], validated["reps"], validated["sets"]) == (MAX_WEIGHT, MAX_REPS, MAX_SETS)
+
+
+class _RecordingManager:
+    """insert_records 호출을 기록하는 테스트용 데이터베이스 관리자."""
+
+    def __init__(self, result=None):
+        self.result = result # None이면 넘겨받은 기록 수 반환
+        self.calls = []
+
+    def insert_records(self, records_list, raise_errors=False):
+        self.calls.append(list(records_list))
+        return len(records_list) if self.result is None else self.result
+
+
+def test_add_records_inserts_all_records_once():
+    manager = _RecordingManager()
+    records = WorkoutService(manager).add_records([_data(sets=1), _data(sets=2), _data(sets=3)])
+    assert len(manager.calls) == 1
+    assert manager.calls[0] == records
+    assert [r.sets for r in records] == [1, 2, 3]
+    assert len({r.record_date for r in records}) == 1
+
+
+def test_add_records_reports_every_invalid_index_without_inserting():
+    manager = _RecordingManager()
+    with pytest.raises(ValidationError) as exc_info:
+        WorkoutService(manager).add_records([_data(), _data(exercise_type="벤치"), _data(), _data(sets=0)])
+    message = str(exc_info.value)
+    assert message.startswith("[1] ")
+    assert "; [3] " in message
+    assert "[0]" not in message and "[2]" not in message
+    assert manager.calls == []
+
+
+@pytest.mark.parametrize("body", [[], {}, None])
+def test_add_records_requires_non_empty_list(body):
+    with pytest.raises(ValidationError, match="non-empty list"):
+        WorkoutService(_RecordingManager()).add_records(body)
+
+
+def test_add_records_failed_insert_raises_database_error():
+    with pytest.raises(DatabaseServiceError):
+        WorkoutService(_RecordingManager(result=0)).add_records([_data()])